@@ -9,7 +9,13 @@ NOTES:
     as the table is not aware of its parent schema's name change.
 """
 
+import io
+import threading
+from contextlib import contextmanager
 import psycopg2 as pg2
+from psycopg2 import sql
+from psycopg2.extensions import register_adapter, adapt, AsIs
+from psycopg2.pool import ThreadedConnectionPool
 from psycopg2.extras import execute_values
 import numpy as np
 import pandas as pd
@@ -31,36 +37,177 @@ type_conversion = {int: 'int',  # used to convert between python data type and S
                    pd._libs.tslibs.timestamps.Timestamp: 'timestamp'
                    }
 
+dtype_conversion = {np.dtype('int64'): 'int',  # used to convert between numpy column dtypes and SQL data types
+                    np.dtype('int32'): 'int',
+                    np.dtype('float64'): 'real',
+                    np.dtype('float32'): 'real',
+                    np.dtype('bool'): 'bool',
+                    np.dtype('<M8[ns]'): 'timestamp'
+                    }
+
+binary_conversion = {'int': np.dtype('>i4'),  # used to convert between SQL data types and PostgreSQL's binary format
+                     'real': np.dtype('>f4'),
+                     'bool': np.dtype('?')
+                     }
+
+copy_read_types = ['smallint', 'integer', 'bigint', 'real', 'double precision', 'boolean',  # SQL data types that
+                   'text', 'character varying', 'character',  # pandas parses back faithfully from COPY's CSV output
+                   'date', 'timestamp without time zone', 'timestamp with time zone']
+
+# WHERE condition on pg_namespace that leaves out the system schemas, shared by database.meta and database.__getitem__
+user_schemas_condition = """nspname != 'pg_catalog'
+                        AND nspname != 'information_schema'
+                        AND nspname !~ '^pg_(toast|temp_)'"""
+
+
+def adapt_numpy_float(value):
+    """
+    Converts a numpy float into SQL for psycopg2, with NaN becoming NULL.
+
+    :param value: numpy float.
+
+    :return: psycopg2 adapter for the value.
+    """
+    if np.isnan(value):
+        return AsIs('NULL')
+    else:
+        return adapt(float(value))
+
+
+# let psycopg2 pass numpy scalars (e.g. from object columns) straight into queries
+register_adapter(np.int64, lambda value: adapt(int(value)))
+register_adapter(np.int32, lambda value: adapt(int(value)))
+register_adapter(np.float64, adapt_numpy_float)
+register_adapter(np.float32, adapt_numpy_float)
+register_adapter(np.bool_, lambda value: adapt(bool(value)))
+
+
+def binary_copy_buffer(dataframe, data_types):
+    """
+    Serialises a DataFrame into PostgreSQL's binary COPY format straight from its numpy arrays, so that no value has to
+    be converted to text. This is only possible if every column is a numeric or bool dtype with no nulls, as then
+    every row has the same layout.
 
-def execute(database, query, return_values=True):
+    :param dataframe: DataFrame to serialise.
+    :param data_types: the SQL data type of each column, e.g. ['int', 'real'].
+
+    :return: buffer to pass to COPY ... FROM STDIN WITH (FORMAT binary), or None if the DataFrame can't be serialised.
+    """
+    fields = [('field_count', '>i2')]  # each row is the number of fields, then each field's byte length and value
+    arrays = []
+
+    for i, (dtype, data_type) in enumerate(zip(dataframe.dtypes, data_types)):
+        if (not isinstance(dtype, np.dtype)) or (dtype.kind not in 'iufb') or (data_type not in binary_conversion):
+            return None
+
+        array = dataframe.iloc[:, i].to_numpy()
+
+        if (dtype.kind == 'f') and np.isnan(array).any():  # a null field has no value, so the rows wouldn't line up
+            return None
+
+        if (dtype.kind == 'f') and (len(array) > 0):  # real columns are 4 bytes, so check nothing would overflow to inf
+            if np.abs(array[np.isfinite(array)]).max(initial=0) > np.finfo(np.float32).max:
+                return None
+
+        if (dtype.kind in 'iu') and (len(array) > 0):  # int columns are 4 bytes, so check nothing would overflow
+            if (array.min() < np.iinfo(np.int32).min) | (array.max() > np.iinfo(np.int32).max):
+                return None
+
+        fields += [('length{0}'.format(i), '>i4'), ('value{0}'.format(i), binary_conversion[data_type])]
+        arrays.append(array)
+
+    rows = np.empty(len(dataframe), dtype=fields)
+    rows['field_count'] = len(arrays)
+
+    for i, array in enumerate(arrays):
+        rows['length{0}'.format(i)] = binary_conversion[data_types[i]].itemsize
+        rows['value{0}'.format(i)] = array
+
+    header = b'PGCOPY\n\xff\r\n\x00' + np.array([0, 0], dtype='>i4').tobytes()  # signature, flags, extension length
+    trailer = np.array([-1], dtype='>i2').tobytes()
+
+    return io.BytesIO(header + rows.tobytes() + trailer)
+
+
+def read_copy_csv(buffer, data_types):
+    """
+    Parses the output of COPY ... TO STDOUT WITH (FORMAT csv, NULL '\\N') with pandas' C parser.
+
+    pandas can't tell a quoted "\\N" from an unquoted \\N, so a text value of exactly \\N is returned as NaN, the same
+    as a NULL. Read through psycopg2 (fast_read=False) if the data may contain such values.
+
+    :param buffer: file-like object containing the CSV output.
+    :param data_types: the SQL data type of each column, all of which must be in copy_read_types.
+
+    :return: A dataframe of the CSV data, with the columns labelled 0, 1, 2...
+    """
+    dtype = {}  # columns which should be kept as strings rather than inferred by pandas
+    parse_dates = []
+    na_values = {}
+    for i, data_type in enumerate(data_types):
+        na_values[i] = ['\\N']
+
+        if (data_type == 'date') | data_type.startswith('timestamp'):
+            parse_dates.append(i)
+        elif data_type in ('text', 'character varying', 'character'):
+            dtype[i] = str
+        elif data_type in ('real', 'double precision'):
+            na_values[i].append('NaN')  # PostgreSQL writes float NaN as NaN, which pandas only parses as an NA value
+
+    # an empty string is written as an empty line in a single-column result, so blank lines mustn't be skipped
+    return pd.read_csv(buffer, header=None, names=range(len(data_types)), dtype=dtype, parse_dates=parse_dates,
+                       na_values=na_values, keep_default_na=False, skip_blank_lines=False, true_values=['t'],
+                       false_values=['f'])
+
+
+def execute(database, query, return_values=True, params=None, stream=False, chunk_size=10000):
     """
     Executes a query and returns the results using a given database connection.
 
     :param database: database object.
-    :param query: query to be executed.
+    :param query: query to be executed, either a string or a psycopg2.sql object.
     :param return_values: If true, this function will return the output of the query. Set to false to avoid an error when
     the query does not return anything.
+    :param params: tuple of values to be passed into the %s placeholders in the query.
+    :param stream: If true, the results are fetched from a server-side cursor chunk_size rows at a time and returned
+    column by column, so the full list of row tuples is never held in memory.
+    :param chunk_size: number of rows to fetch at a time when stream is true.
 
-    :return: query results.
+    :return: query results. A list of rows, or a list of columns (each a list of values) if stream is true.
     """
-    cur = database.con.cursor()
-
-    try:
-        # execute query
-        cur.execute(query)
-        database.con.commit()
-    except:
-        # if there was an error, rollback and raise exception
-        database.con.rollback()
-        raise
-
-    if return_values:
-        rows = cur.fetchall()
-        cur.close()
-        return rows
-    else:
-        cur.close()
-        return
+    with database.connection() as con:  # borrow a connection from the pool for this query
+        try:
+            if stream:
+                # a named cursor keeps the result set on the server, it only lives until the commit so the results are
+                # fetched inside the with block
+                with con.cursor(name='pgpy_stream') as cur:
+                    cur.execute(query, params)
+                    results = None
+
+                    while True:
+                        rows = cur.fetchmany(chunk_size)
+
+                        if results is None:
+                            results = [[] for _ in cur.description]
+
+                        if len(rows) == 0:
+                            break
+
+                        for values, chunk in zip(results, zip(*rows)):  # transpose the chunk into its columns
+                            values.extend(chunk)
+            else:
+                with con.cursor() as cur:
+                    # execute query
+                    cur.execute(query, params)
+                    results = cur.fetchall() if return_values else None
+
+            con.commit()
+        except:
+            # if there was an error, rollback and raise exception
+            con.rollback()
+            raise
+
+        return results
 
 
 class database:
@@ -69,7 +216,8 @@ class database:
     This class uses psycopg2 to provide functions to do common tasks
     """
 
-    def __init__(self, user, password, host='127.0.0.1', port='5432', database='postgres'):
+    def __init__(self, user, password, host='127.0.0.1', port='5432', database='postgres', max_connections=16,
+                 min_connections=None):
         """
         Initilise database class by connecting to a database.
 
@@ -78,12 +226,25 @@ class database:
         :param host: database host address, e.g. '127.0.0.1'
         :param port: database port number, e.g. '5432'
         :param database: database name, e.g. 'postgres'
+        :param max_connections: maximum number of connections that can be open to the database at once, e.g. by
+            several threads using this object. Any further threads wait until a connection is free.
+        :param min_connections: number of connections opened up front and kept open between queries. Defaults to
+            max_connections, so that connections are reused rather than reopened; set it lower to open fewer.
         """
-        self.con = pg2.connect(user=user,
-                               password=password,
-                               host=host,
-                               port=port,
-                               database=database)
+        if min_connections is None:
+            min_connections = max_connections
+
+        # each query borrows its own connection, so an error in one thread can't rollback another thread's work
+        self._pool = ThreadedConnectionPool(minconn=min_connections,
+                                            maxconn=max_connections,
+                                            user=user,
+                                            password=password,
+                                            host=host,
+                                            port=port,
+                                            database=database)
+        # the pool raises an error rather than waiting when all of its connections are in use, so count them here
+        self._free_connections = threading.BoundedSemaphore(max_connections)
+        self._meta_cache = None  # stores the result of meta() until the database is changed through this object
 
     def __getitem__(self, item):
         """
@@ -94,19 +255,67 @@ class database:
         :return: object representing the schema.
         """
 
-        if item in self.meta()['schemas']:
+        if self._meta_cache is not None:
+            exists = item in self._meta_cache['schemas']
+        else:  # look up just this schema, rather than listing every schema with meta()
+            query = """SELECT 1 FROM pg_catalog.pg_namespace
+                            WHERE nspname = %s
+                            AND {0};
+                    """.format(user_schemas_condition)
+            exists = len(execute(self, query, params=(item,))) > 0
+
+        if exists:
             return schema(self, item)
         else:
             raise ValueError("The '{0}' schema does not exist.".format(item))
 
+    @contextmanager
+    def connection(self):
+        """
+        Borrows a connection from the pool, and returns it to the pool at the end of the with block:
+            with database.connection() as con:
+                ...
+
+        If every connection is in use, this waits until one is returned.
+
+        :return: psycopg2 connection.
+        """
+        with self._free_connections:
+            con = self._pool.getconn()
+
+            try:
+                yield con
+            finally:
+                self._pool.putconn(con)  # the pool rolls back any transaction left open
+
+    @contextmanager
+    def bulk_load_mode(self):
+        """
+        Borrows a connection like connection(), but with synchronous_commit turned off for its first transaction:
+            with database.bulk_load_mode() as con:
+                ...
+                con.commit()
+
+        The commit then returns without waiting for the WAL to be flushed to disk, which is much faster when loading
+        data. The tradeoff is that if the server crashes just after the commit, the transaction may be lost (though the
+        database is never left corrupted).
+
+        :return: psycopg2 connection.
+        """
+        with self.connection() as con:
+            with con.cursor() as cur:
+                cur.execute('SET LOCAL synchronous_commit TO OFF;')  # only lasts until the end of the transaction
+
+            yield con
+
     def close(self):
         """
-        Closes database connection.
+        Closes all database connections.
 
         :return: None.
         """
 
-        self.con.close()
+        self._pool.closeall()
 
     def meta(self):
         """
@@ -117,21 +326,32 @@ class database:
             }
         """
 
-        query = """SELECT schema_name FROM information_schema.schemata
-                        WHERE schema_name != 'pg_catalog'
-                        AND schema_name != 'pg_temp_1'
-                        AND schema_name != 'information_schema'
-                        AND schema_name != 'pg_toast'
-                        AND schema_name != 'pg_toast_temp_1';
-                """
+        if self._meta_cache is not None:
+            return self._meta_cache
+
+        # query pg_catalog directly, the information_schema views add expensive joins and privilege checks
+        query = """SELECT nspname FROM pg_catalog.pg_namespace
+                        WHERE {0}
+                        ORDER BY nspname ASC;
+                """.format(user_schemas_condition)
 
         schema_list = execute(self, query)  # get list of schemas
-        schema_list = list(np.array(schema_list).flatten())  # flatten the rows into a 1-d array
+        schema_list = [row[0] for row in schema_list]  # flatten the single-column rows into a list
 
         data = {'schemas': schema_list}
+        self._meta_cache = data
 
         return data
 
+    def refresh(self):
+        """
+        Clears the cached metadata so that the next call to meta() queries the database again. Use this if the
+        database has been changed outside of this object.
+
+        :return: None.
+        """
+        self._meta_cache = None
+
     def create_schema(self, table_schema):
         """
         Creates a schema in this database using:
@@ -141,8 +361,9 @@ class database:
 
         :return: None.
         """
-        query = 'CREATE SCHEMA "{0}";'.format(table_schema)
+        query = sql.SQL('CREATE SCHEMA {0};').format(sql.Identifier(table_schema))
         execute(self, query, return_values=False)
+        self.refresh()
 
 
 class schema:
@@ -159,6 +380,7 @@ class schema:
         """
         self.database = database
         self._table_schema = table_schema
+        self._meta_cache = None  # stores the result of meta() until the schema is changed through this object
 
     def __getitem__(self, item):
         """
@@ -169,8 +391,20 @@ class schema:
         :return: object representing the table.
         """
 
-        if item in self.meta()['tables']:
-            return table(self.database, self.table_schema, item)
+        if self._meta_cache is not None:
+            exists = item in self._meta_cache['tables']
+        else:  # look up just this table, rather than listing every table with meta()
+            query = """SELECT 1
+                            FROM pg_catalog.pg_class c
+                            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                            WHERE n.nspname = %s
+                            AND c.relname = %s
+                            AND c.relkind IN ('r', 'v', 'f', 'p');
+                    """
+            exists = len(execute(self.database, query, params=(self.table_schema, item))) > 0
+
+        if exists:
+            return table(self.database, self.table_schema, item, schema=self)
         else:
             raise ValueError("The '{0}' table does not exist.".format(item))
 
@@ -184,15 +418,32 @@ class schema:
         :return: None
         """
 
-        if table in self.meta()['tables']:  # if table already exists then delete it
-            self[table].delete()
+        self.load(key, value)
 
-        dataframe = value.copy()
+    def load(self, key, value, page_size=1000, synchronous_commit=True, unlogged=False):
+        """
+        Create a new table in this schema from a DataFrame. If a table with the same name already exists then it will overwrite it.
+        This is the same as schema[key] = value, but allows the insert to be tuned.
+
+        :param key: name of table
+        :param value: DataFrame to insert into the database
+        :param page_size: number of rows sent per INSERT statement if the data can't be loaded with COPY. Fewer rows
+            per statement may be better for very wide tables.
+        :param synchronous_commit: set to False to load the table using database.bulk_load_mode(), which doesn't wait
+            for the commit to be flushed to disk. Faster, but the new table may be lost if the server crashes just after
+            it is created.
+        :param unlogged: set to True to create an UNLOGGED table. These skip the WAL so are much faster to write to,
+            but the table is emptied if the server crashes and isn't copied to replicas.
+
+        :return: None
+        """
+
+        dataframe = value  # only read from, so there's no need to copy the whole DataFrame
 
         # if dataframe.index is anything other than the standard numeric, then include it in the table
         if type(dataframe.index) != pd.core.indexes.range.RangeIndex:
             old_column_order = list(dataframe.columns)
-            dataframe['Index'] = dataframe.index
+            dataframe = dataframe.assign(Index=dataframe.index)  # returns a new DataFrame, so value is left unchanged
             new_column_order = list(chain(['Index'], old_column_order))
             dataframe = dataframe[new_column_order]
 
@@ -200,36 +451,94 @@ class schema:
 
         column_and_datatype_string = []
         column_string = []
-        for col in dataframe.columns:
-            first_valid_index = dataframe[col].first_valid_index()
-            first_valid_value = dataframe[col].loc[first_valid_index]
-            data_type = type_conversion[type(first_valid_value)]
-
-            column_and_datatype_string.append('"{0}" {1}'.format(col, data_type))
-            column_string.append('"{0}"'.format(col))
+        data_types = []
+        for col, dtype in zip(dataframe.columns, dataframe.dtypes):
+            data_type = dtype_conversion.get(dtype)
 
-        column_and_datatype_string = '{0}'.format(', '.join(column_and_datatype_string))
-        # stores '(column_name column_type, column_name column_type...)'
+            if data_type is None:  # i.e. an object column, so infer the type from the first non-null value
+                first_valid_value = dataframe[col].dropna().iloc[0]
+                data_type = type_conversion[type(first_valid_value)]
 
-        query = 'CREATE TABLE "{0}"."{1}" ({2}); '.format(self.table_schema, key, column_and_datatype_string)
-        execute(self.database, query, return_values=False) # create table
+            column_and_datatype_string.append(sql.SQL('{0} {1}').format(sql.Identifier(str(col)), sql.SQL(data_type)))
+            column_string.append(sql.Identifier(str(col)))
+            data_types.append(data_type)
 
-        #replace any nulls with None
-        dataframe = pd.DataFrame(np.where(dataframe.isnull() == True, None, dataframe),
-                                 columns=dataframe.columns)
+        column_and_datatype_string = sql.SQL(', ').join(column_and_datatype_string)
+        # stores '(column_name column_type, column_name column_type...)'
 
-        query = 'INSERT INTO "{0}"."{1}" ({2}) VALUES %s'.format(self.table_schema, key, ', '.join(column_string))
+        column_string = sql.SQL(', ').join(column_string)
 
-        try:
-            # execute query
-            execute_values(self.database.con.cursor(),
-                           query,
-                           dataframe.values)
-            self.database.con.commit()
-        except:
-            # if there was an error, rollback and raise exception
-            self.database.con.rollback()
-            raise
+        # replace the table and load the data in one transaction, so there is a single commit and the old table is only
+        # dropped if the new one is loaded successfully
+        if synchronous_commit:
+            connection = self.database.connection
+        else:
+            connection = self.database.bulk_load_mode
+
+        with connection() as con:
+            try:
+                with con.cursor() as cur:
+                    query = sql.SQL('DROP TABLE IF EXISTS {0}.{1};').format(sql.Identifier(self.table_schema),
+                                                                            sql.Identifier(key))
+                    cur.execute(query)  # if table already exists then delete it
+
+                    query = sql.SQL('CREATE {0}TABLE {1}.{2} ({3});').format(sql.SQL('UNLOGGED ' if unlogged else ''),
+                                                                             sql.Identifier(self.table_schema),
+                                                                             sql.Identifier(key),
+                                                                             column_and_datatype_string)
+                    cur.execute(query)
+                    cur.execute('SAVEPOINT bulk_load;')  # lets a failed COPY be undone without losing the new table
+
+                    # bulk load the data with COPY, this avoids the server parsing an INSERT for every row
+                    buffer = binary_copy_buffer(dataframe, data_types)
+
+                    # the CSV COPY writes nulls as an unquoted \N, and pandas can't quote real values without also
+                    # quoting the nulls, so a text value of exactly \N would be loaded as NULL. Insert those instead
+                    has_null_marker = False
+                    for i, dtype in enumerate(dataframe.dtypes):
+                        if (not isinstance(dtype, np.dtype)) or (dtype.kind not in 'iufbM'):
+                            has_null_marker = has_null_marker or dataframe.iloc[:, i].eq('\\N').any()
+
+                    if buffer is not None:  # i.e. all numeric data, which can be sent without converting to text
+                        query = sql.SQL('COPY {0}.{1} ({2}) FROM STDIN WITH (FORMAT binary)')
+                    elif not has_null_marker:
+                        buffer = io.StringIO()
+                        dataframe.to_csv(buffer, sep='\t', header=False, index=False, na_rep='\\N')
+                        buffer.seek(0)
+
+                        query = sql.SQL("COPY {0}.{1} ({2}) FROM STDIN "
+                                        "WITH (FORMAT csv, DELIMITER E'\\t', NULL '\\N')")
+                    else:
+                        query = None
+
+                    copied = False
+                    if query is not None:
+                        try:
+                            query = query.format(sql.Identifier(self.table_schema), sql.Identifier(key), column_string)
+                            cur.copy_expert(query, buffer)
+                            copied = True
+                        except pg2.Error:
+                            # COPY can't parse some data (e.g. exotic types), so fall back to execute_values
+                            cur.execute('ROLLBACK TO SAVEPOINT bulk_load;')
+
+                    if not copied:
+                        # lazily build the rows, replacing any nulls with None
+                        rows = (tuple(None if (v is pd.NA) | (v is pd.NaT) | (isinstance(v, float) and v != v) else v
+                                      for v in row)
+                                for row in dataframe.itertuples(index=False, name=None))
+
+                        query = sql.SQL('INSERT INTO {0}.{1} ({2}) VALUES %s').format(sql.Identifier(self.table_schema),
+                                                                                      sql.Identifier(key),
+                                                                                      column_string)
+                        execute_values(cur, query, rows, page_size=page_size)
+
+                con.commit()
+            except:
+                # if there was an error, rollback and raise exception
+                con.rollback()
+                raise
+
+        self.refresh()
 
     def meta(self):
         """:return: A dict of all metadata for the schema: schema name; tables.
@@ -240,30 +549,49 @@ class schema:
             }
         """
 
-        query = """SELECT DISTINCT table_name
-                        FROM information_schema.columns
-                        WHERE table_schema = '{0}'
-                        ORDER BY table_name ASC;
-                """.format(self.table_schema)
+        if self._meta_cache is not None:
+            return self._meta_cache
 
-        tables = execute(self.database, query)  # execute above query
-        tables = list(np.array(tables).flatten())  # flatten the rows into a 1-d array
+        # tables, views, foreign tables and partitioned tables; the same relations information_schema.columns lists
+        query = """SELECT c.relname
+                        FROM pg_catalog.pg_class c
+                        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                        WHERE n.nspname = %s
+                        AND c.relkind IN ('r', 'v', 'f', 'p')
+                        ORDER BY c.relname ASC;
+                """
+
+        tables = execute(self.database, query, params=(self.table_schema,))  # execute above query
+        tables = [row[0] for row in tables]  # flatten the single-column rows into a list
 
         data = {
             'name': self.table_schema,
             'tables': tables
         }
+        self._meta_cache = data
 
         return data
 
+    def refresh(self):
+        """
+        Clears the cached metadata so that the next call to meta() queries the database again. Use this if the
+        schema has been changed outside of this object.
+
+        :return: None.
+        """
+        self._meta_cache = None
+
     @property
     def table_schema(self):  # retrieve schema name
         return self._table_schema
 
     def rename(self, new_name):  # alters the schema name
-        query = 'ALTER SCHEMA "{0}" RENAME TO "{1}";'.format(self.table_schema, new_name)
+        query = sql.SQL('ALTER SCHEMA {0} RENAME TO {1};').format(sql.Identifier(self.table_schema),
+                                                                  sql.Identifier(new_name))
         execute(self.database, query, return_values=False)
         self._table_schema = new_name
+        self.refresh()
+        self.database.refresh()
 
     def delete(self, cascade=False):
         """
@@ -277,31 +605,36 @@ class schema:
         :return: None.
         """
 
-        if cascade == True:
-            query = 'DROP SCHEMA "{0}" CASCADE;'.format(self.table_schema)
-            execute(self.database, query, return_values=False)
-        elif cascade == False:
-            query = 'DROP SCHEMA "{0}";'.format(self.table_schema)
-            execute(self.database, query, return_values=False)
-        else:
+        if cascade not in (True, False):
             raise ValueError("Argument 'cascade' needs to be either True or False.")
 
+        query = sql.SQL('DROP SCHEMA {0}{1};').format(sql.Identifier(self.table_schema),
+                                                      sql.SQL(' CASCADE' if cascade else ''))
+        execute(self.database, query, return_values=False)
+
+        self.database.refresh()
+
 
 class table:
     """
     An object representing a connection to a specified table
     """
 
-    def __init__(self, database, table_schema, table_name):
+    def __init__(self, database, table_schema, table_name, schema=None):
         self.database = database
         self.table_schema = table_schema
+        self.schema = schema  # the parent schema, if any, whose cached list of tables is cleared by rename and delete
         self._table_name = table_name
-        self._columns = list(self.meta().keys())
+        self._meta_cache = None  # stores the result of meta() until the table is changed through this object
+        self._columns = None  # the column names, in the order they are in the table
+        self._all_columns_sql = None  # the column names joined into '"column1", "column2", ...' for SELECT queries
+        self.fast_read = True  # the default for whether table[...] and select() read the data with COPY
+        self.refresh()
 
     def __getitem__(self, item):
         # item = column name or list of column names
 
-        columns = self.meta()['columns'].keys()  # a list of all columns in the database
+        columns = self._columns  # a list of all columns in the database
 
         is_iterable = (type(item) == list) | (type(item) == tuple)  # checks if a list of columns was entered
 
@@ -313,25 +646,20 @@ class table:
             if (not (item in columns)) & (item != '*'):
                 raise ValueError("The specified column, '{0}', doesn't exist in the table.".format(item))
 
-            item = [item]  # convert to list so that ', '.join(item) works later on
-
-        if item != ['*']:
-            query = 'SELECT {0} FROM "{1}"."{2}"'.format('"' + '", "'.join(item) + '"',
-                                                         self.table_schema,
-                                                         self.table_name)
-        else:
-            query = 'SELECT * FROM "{0}"."{1}"'.format(self.table_schema, self.table_name)
-
-        rows = execute(self.database, query)
-
-        data = pd.DataFrame(rows)
+            item = [item]  # convert to list so that the column names can be joined later on
 
+        # always list the columns explicitly, so the results are in the same order as the column names used below
         if item == ['*']:
-            data.columns = columns  # use the ordered meta().keys() as the column headers
+            item = columns
+            columns_sql = self._all_columns_sql
         else:
-            data.columns = item  # use the users input
+            columns_sql = sql.SQL(', ').join(map(sql.Identifier, item))
 
-        return data
+        query = sql.SQL('SELECT {0} FROM {1}.{2}').format(columns_sql,
+                                                          sql.Identifier(self.table_schema),
+                                                          sql.Identifier(self.table_name))
+
+        return self._read(query, item, self.fast_read)
 
     def meta(self):
         """:return: A dict containing all the metadata of the table: name; column names and their data type.
@@ -345,36 +673,57 @@ class table:
                 }
         """
 
-        query = """SELECT column_name, data_type 
-                        FROM information_schema.columns
-                        WHERE table_schema = '{0}'
-                        AND table_name = '{1}'
-                        ORDER BY ordinal_position ASC;
-                """.format(self.table_schema, self.table_name)
+        if self._meta_cache is not None:
+            return self._meta_cache
+
+        query = """SELECT a.attname, pg_catalog.format_type(a.atttypid, NULL)
+                        FROM pg_catalog.pg_attribute a
+                        JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+                        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                        WHERE n.nspname = %s
+                        AND c.relname = %s
+                        AND a.attnum > 0
+                        AND NOT a.attisdropped
+                        ORDER BY a.attnum ASC;
+                """
 
-        rows = execute(self.database, query)  # execute above query
+        rows = execute(self.database, query, params=(self.table_schema, self.table_name))  # execute above query
         # the output will be structured like [(columns_name, data_type), (column_name, data_type)...]
 
-        columns = {}  # will store the column/data type
-
-        for row in rows:
-            columns[row[0]] = row[1]
+        columns = dict(rows)  # will store the column/data type
 
         data = {
             'name': self._table_name,
             'columns': columns
         }
+        self._meta_cache = data
 
         return data
 
+    def refresh(self):
+        """
+        Clears the cached metadata and reads the column names from the database again. Use this if the table has been
+        changed outside of this object.
+
+        :return: None.
+        """
+        self._meta_cache = None
+        self._columns = list(self.meta()['columns'].keys())
+        self._all_columns_sql = sql.SQL(', ').join(map(sql.Identifier, self._columns))
+
     @property
     def table_name(self):
         return self._table_name
 
     def rename(self, new_name):  # alters the table name
-        query = 'ALTER TABLE "{0}"."{1}" RENAME TO "{2}";'.format(self.table_schema, self.table_name, new_name)
+        query = sql.SQL('ALTER TABLE {0}.{1} RENAME TO {2};').format(sql.Identifier(self.table_schema),
+                                                                     sql.Identifier(self.table_name),
+                                                                     sql.Identifier(new_name))
         execute(self.database, query, return_values=False)
         self._table_name = new_name
+        self.refresh()
+        if self.schema is not None:
+            self.schema.refresh()
 
     def rename_columns(self, new_columns):
         """
@@ -386,33 +735,36 @@ class table:
 
         :return: None
         """
-        old_columns = list(self.meta()['columns'].keys())
-
-        query = ''
+        old_columns = self._columns
 
         if (type(new_columns) == list) | (type(new_columns) == tuple):
-            for old_column, new_column in zip(old_columns, new_columns):
-                if old_column == new_column:  # skip if the new name is identical to the old one
-                    continue
+            renames = zip(old_columns, new_columns)
+        elif type(new_columns) == dict:
+            for old_column in new_columns.keys():
+                if old_column not in old_columns:
+                    raise ValueError('"{0}" is not an existing column in this table'.format(old_column))
 
-                query += 'ALTER TABLE "{0}"."{1}" RENAME COLUMN "{2}" TO "{3}"; '.format(
-                    self.table_schema, self.table_name, old_column, new_column
-                )
+            renames = new_columns.items()
+        else:
+            raise ValueError("Argument 'new_columns' needs to be either a list, tuple or dict.")
 
+        # PostgreSQL only allows one RENAME COLUMN per ALTER TABLE, so build one statement per renamed column. These are
+        # all sent in one round trip and run in a single transaction, so the table is never left partially renamed
+        query = []
+        rename_column = sql.SQL('ALTER TABLE {0}.{1} RENAME COLUMN {2} TO {3};')
 
+        for old_column, new_column in renames:
+            if old_column == new_column:  # skip if the new name is identical to the old one
+                continue
 
-            if query == '':  # i.e. if all the old column names are the same as the new ones
-                return
-        elif type(new_columns) == dict:
-            for old_column, new_column in zip(list(new_columns.keys()), list(new_columns.values())):
-                if old_column not in old_columns:
-                    raise ValueError('"{0}" is not an existing column in this table'.format(old_column))
+            query.append(rename_column.format(sql.Identifier(self.table_schema), sql.Identifier(self.table_name),
+                                              sql.Identifier(old_column), sql.Identifier(new_column)))
 
-                query += 'ALTER TABLE "{0}"."{1}" RENAME COLUMN "{2}" TO "{3}"; '.format(
-                    self.table_schema, self.table_name, old_column, new_column
-                )
+        if len(query) == 0:  # i.e. if all the old column names are the same as the new ones
+            return
 
-        execute(self.database, query, return_values=False)
+        execute(self.database, sql.SQL(' ').join(query), return_values=False)
+        self.refresh()
 
     def delete(self):
         """
@@ -422,26 +774,86 @@ class table:
         :return: None.
         """
 
-        query = 'DROP TABLE "{0}"."{1}";'.format(self.table_schema, self.table_name)
+        query = sql.SQL('DROP TABLE {0}.{1};').format(sql.Identifier(self.table_schema),
+                                                      sql.Identifier(self.table_name))
         execute(self.database, query, return_values=False)
+        self.refresh()
+        if self.schema is not None:
+            self.schema.refresh()
 
-    def select(self, conditions=''):
+    def select(self, conditions='', fast_read=None):
         """
         Create a custom query on a table. Include all the text following: 'SELECT * FROM schema.table'...
 
         :param conditions: A string consisting of the WEHRE, ORDER BY (etc.) clauses.
+        :param fast_read: If true, the results are read with COPY and parsed by pandas, as long as every column has a
+            type that can be parsed faithfully (see copy_read_types). Set to false to get the values exactly as psycopg2
+            returns them (e.g. datetime.date rather than pandas Timestamps). Defaults to the table's fast_read attribute.
 
         :return: A dataframe of the results of the query.
         """
 
-        columns = list(self.meta().keys())
-        query = 'SELECT {3} FROM "{0}"."{1}" {2}'.format(self.table_schema, self.table_name, conditions,
-                                                         '"' + '", "'.join(columns) + '"')
+        columns = self._columns
+        # the query may be wrapped in COPY (...), so strip any trailing semicolon from the conditions
+        query = sql.SQL('SELECT {3} FROM {0}.{1} {2}').format(sql.Identifier(self.table_schema),
+                                                              sql.Identifier(self.table_name),
+                                                              sql.SQL(conditions.strip().rstrip(';')),
+                                                              self._all_columns_sql)
+
+        if fast_read is None:
+            fast_read = self.fast_read
+
+        return self._read(query, columns, fast_read)
+
+    def _read(self, query, columns, fast_read):
+        """
+        Runs a SELECT query on this table and returns the results as a DataFrame.
+
+        :param query: SELECT query on this table, without a trailing semicolon.
+        :param columns: names of the columns returned by the query.
+        :param fast_read: If true, read the results with COPY when every column's type allows it.
 
-        if conditions == '':
-            query += ';'
+        :return: A dataframe of the results of the query.
+        """
+        data_types = self.meta()['columns']
 
-        rows = execute(self.database, query)
+        if fast_read & all(data_types[col] in copy_read_types for col in columns):
+            data = self._read_copy(query, columns)
+        else:  # e.g. numeric, time or json columns, which psycopg2 converts to the right Python types
+            columns_values = execute(self.database, query, stream=True)
+            data = pd.DataFrame(dict(enumerate(columns_values)))
 
-        data = pd.DataFrame(rows, columns=columns)
-        return data
\ No newline at end of file
+        data.columns = columns
+        return data
+
+    def _read_copy(self, query, columns):
+        """
+        Runs a SELECT query with COPY ... TO STDOUT and parses the CSV output with pandas' C parser, which avoids
+        psycopg2 building a Python tuple for every row.
+
+        See read_copy_csv for the one value that isn't read back faithfully.
+
+        :param query: SELECT query on this table, without a trailing semicolon.
+        :param columns: names of the columns returned by the query, used to choose how each column is parsed. Their
+            types must all be in copy_read_types.
+
+        :return: A dataframe of the results of the query, with the columns labelled 0, 1, 2...
+        """
+        buffer = io.StringIO()
+        with self.database.connection() as con:
+            try:
+                with con.cursor() as cur:
+                    # NULL is written as \N so that it can be told apart from an empty string
+                    query = sql.SQL("COPY ({0}) TO STDOUT WITH (FORMAT csv, NULL '\\N')").format(query)
+                    cur.copy_expert(query, buffer)
+
+                con.commit()
+            except:
+                # if there was an error, rollback and raise exception
+                con.rollback()
+                raise
+
+        buffer.seek(0)
+
+        data_types = self.meta()['columns']
+        return read_copy_csv(buffer, [data_types[col] for col in columns])
\ No newline at end of file
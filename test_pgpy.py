@@ -0,0 +1,109 @@
+"""
+Tests for the parts of pgpy that don't need a database connection.
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+import pgpy
+
+HEADER = b'PGCOPY\n\xff\r\n\x00' + b'\x00\x00\x00\x00' + b'\x00\x00\x00\x00'  # signature, flags, extension length
+TRAILER = b'\xff\xff'
+
+
+def test_binary_copy_buffer_header_and_trailer():
+    data = pgpy.binary_copy_buffer(pd.DataFrame({'a': np.array([], dtype=np.int64)}), ['int']).getvalue()
+
+    assert len(HEADER) == 19
+    assert data == HEADER + TRAILER
+
+
+def test_binary_copy_buffer_int_row():
+    data = pgpy.binary_copy_buffer(pd.DataFrame({'a': [5]}), ['int']).getvalue()
+
+    # field count, field length, big-endian int4
+    assert data == HEADER + b'\x00\x01' + b'\x00\x00\x00\x04' + b'\x00\x00\x00\x05' + TRAILER
+
+
+def test_binary_copy_buffer_real_row():
+    data = pgpy.binary_copy_buffer(pd.DataFrame({'a': [1.5]}), ['real']).getvalue()
+
+    # field count, field length, big-endian float4
+    assert data == HEADER + b'\x00\x01' + b'\x00\x00\x00\x04' + b'\x3f\xc0\x00\x00' + TRAILER
+
+
+def test_binary_copy_buffer_bool_row():
+    data = pgpy.binary_copy_buffer(pd.DataFrame({'a': [True]}), ['bool']).getvalue()
+
+    # field count, field length, one byte bool
+    assert data == HEADER + b'\x00\x01' + b'\x00\x00\x00\x01' + b'\x01' + TRAILER
+
+
+def test_binary_copy_buffer_mixed_row():
+    dataframe = pd.DataFrame({'a': [-1], 'b': [1.5], 'c': [False]})
+    data = pgpy.binary_copy_buffer(dataframe, ['int', 'real', 'bool']).getvalue()
+
+    assert data == (HEADER + b'\x00\x03'
+                    + b'\x00\x00\x00\x04' + b'\xff\xff\xff\xff'
+                    + b'\x00\x00\x00\x04' + b'\x3f\xc0\x00\x00'
+                    + b'\x00\x00\x00\x01' + b'\x00'
+                    + TRAILER)
+
+
+def test_binary_copy_buffer_rejects_nan():
+    assert pgpy.binary_copy_buffer(pd.DataFrame({'a': [1.5, np.nan]}), ['real']) is None
+
+
+def test_binary_copy_buffer_rejects_int32_overflow():
+    assert pgpy.binary_copy_buffer(pd.DataFrame({'a': [2 ** 31]}), ['int']) is None
+    assert pgpy.binary_copy_buffer(pd.DataFrame({'a': [-2 ** 31 - 1]}), ['int']) is None
+
+
+def test_binary_copy_buffer_rejects_real_overflow():
+    assert pgpy.binary_copy_buffer(pd.DataFrame({'a': [1e39]}), ['real']) is None
+
+
+def test_binary_copy_buffer_rejects_datetime():
+    dataframe = pd.DataFrame({'a': pd.to_datetime(['2020-01-01'])})
+
+    assert pgpy.binary_copy_buffer(dataframe, ['timestamp']) is None
+
+
+def test_read_copy_csv_keeps_empty_strings():
+    # a single text column writes an empty string as an empty line, which must not be skipped
+    data = pgpy.read_copy_csv(io.StringIO('a\n\n\\N\nb\n'), ['text'])
+
+    assert len(data) == 4
+    assert data[0].iloc[0] == 'a'
+    assert data[0].iloc[1] == ''
+    assert pd.isna(data[0].iloc[2])
+    assert data[0].iloc[3] == 'b'
+
+
+def test_read_copy_csv_parses_float_special_values():
+    data = pgpy.read_copy_csv(io.StringIO('1.5,2\nNaN,\\N\nInfinity,3\n-Infinity,4\n\\N,5\n'),
+                              ['double precision', 'integer'])
+
+    assert data[0].dtype == np.float64
+    assert data[0].iloc[0] == 1.5
+    assert np.isnan(data[0].iloc[1])
+    assert data[0].iloc[2] == np.inf
+    assert data[0].iloc[3] == -np.inf
+    assert np.isnan(data[0].iloc[4])
+
+
+def test_read_copy_csv_parses_bool_and_dates():
+    data = pgpy.read_copy_csv(io.StringIO('t,2020-01-02\nf,\\N\n'), ['boolean', 'date'])
+
+    assert data[0].tolist() == [True, False]
+    assert data[1].iloc[0] == pd.Timestamp('2020-01-02')
+    assert pd.isna(data[1].iloc[1])
+
+
+def test_read_copy_csv_empty_result():
+    data = pgpy.read_copy_csv(io.StringIO(''), ['text', 'integer'])
+
+    assert len(data) == 0
+    assert list(data.columns) == [0, 1]